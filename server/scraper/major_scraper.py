@@ -0,0 +1,526 @@
+import os
+import re
+import sys
+import math
+import argparse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+from bs4 import BeautifulSoup
+
+CATALOG_MAJOR_URL = "https://catalog.registrar.ucla.edu/major/2024/{slug}"
+
+# Major name (as stored in the Major table) to catalog page slug mapping
+MAJOR_PAGES = {
+    'Aerospace Engineering': 'AerospaceEngineeringBS',
+    'Bioengineering': 'BioengineeringBS',
+    'Chemical Engineering': 'ChemicalEngineeringBS',
+    'Civil Engineering': 'CivilEngineeringBS',
+    'Computer Engineering': 'ComputerEngineeringBS',
+    'Computer Science': 'ComputerScienceBS',
+    'Computer Science and Engineering': 'ComputerScienceandEngineeringBS',
+    'Electrical Engineering': 'ElectricalEngineeringBS',
+    'Materials Engineering': 'MaterialsEngineeringBS',
+    'Mechanical Engineering': 'MechanicalEngineeringBS',
+}
+
+# Subject names as written in the catalog prose to their course code abbreviation
+SUBJECT_ABBR_MAP = {
+    'Bioengineering': 'BIOENGR',
+    'Chemical Engineering': 'CH ENGR',
+    'Chemistry and Biochemistry': 'CHEM',
+    'Civil and Environmental Engineering': 'C&EE',
+    'Computer Science': 'COM SCI',
+    'Electrical and Computer Engineering': 'EC ENGR',
+    'Engineering': 'ENGR',
+    'English Composition': 'ENGCOMP',
+    'Life Sciences': 'LIFESCI',
+    'Materials Science and Engineering': 'MAT SCI',
+    'Mathematics': 'MATH',
+    'Mechanical and Aerospace Engineering': 'MECH&AE',
+    'Physics': 'PHYSICS',
+    'Statistics': 'STATS',
+}
+
+# Subjects accepted in course codes: the prose names plus the abbreviations themselves
+KNOWN_SUBJECTS = {**SUBJECT_ABBR_MAP, **{abbr: abbr for abbr in SUBJECT_ABBR_MAP.values()}}
+# Subjects that end other subject names (e.g. 'Engineering'), never preceded by a capitalized word
+SUFFIX_SUBJECTS = {
+    subject for subject in KNOWN_SUBJECTS
+    if any(other.endswith(" " + subject) for other in KNOWN_SUBJECTS)
+}
+
+# Heading keyword to RequirementGroup.type mapping (anything else is 'Major')
+GROUP_TYPE_MAP = {
+    'preparation': 'Prep',
+    'technical breadth': 'Tech Breadth',
+}
+
+# Headings that are maintained by ge_scraper.py and must not be duplicated here
+SKIPPED_HEADINGS = ('general education', 'ge requirements')
+
+NUMBER_WORDS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+}
+
+# Units assumed per course when an elective is given in units ("20 units from ...")
+DEFAULT_UNITS = 4
+
+# Rows per multi-row INSERT, keeps each statement well under max_allowed_packet
+SQL_BATCH_SIZE = 500
+
+CAT_NUM = r"(?:CM|M|C)?\d+[A-Z]{0,2}"
+COUNT = r"(one|two|three|four|five|six|seven|eight|nine|ten|\d+)"
+# A capitalized run followed by catalog numbers, e.g. "Computer Science 31, 32, and 35L".
+# The run is only a candidate, its subject is resolved against KNOWN_SUBJECTS.
+COURSE_RUN_RE = re.compile(
+    r"([A-Z][A-Za-z&/]*(?:\s+(?:and\s+)?[A-Z][A-Za-z&/]*)*)\s+"
+    rf"({CAT_NUM}(?:\s*(?:,\s*(?:and\s+|or\s+)?|and\s+|or\s+){CAT_NUM})*)\b"
+)
+CAT_NUM_RE = re.compile(rf"\b{CAT_NUM}\b")
+# Text allowed between two courses of the same list: ",", "and", "or", ", or", ...
+LIST_SEPARATOR_RE = re.compile(r"\s*,?\s*(?:(and|or)\s+)?", re.IGNORECASE)
+# "two courses from", "20 units selected from", "one of the following", "one of"
+CHOOSE_RE = re.compile(
+    rf"\b{COUNT}\s+(?:(?:additional|upper[- ]division|elective)\s+)*"
+    r"(?:(courses?|units?)\s+(?:(?:selected|chosen)\s+)?from|of(?:\s+the\s+following)?)\b",
+    re.IGNORECASE,
+)
+GROUP_CHOOSE_RE = re.compile(rf"\b{COUNT}\s+of\s+the\s+following\b", re.IGNORECASE)
+
+class Requirement:
+    """A set of course codes of which coursesToChoose must be taken."""
+    def __init__(self, name: str, courses_to_choose: int, codes: List[str]):
+        self.name = name[:191]
+        self.courses_to_choose = courses_to_choose
+        self.codes = codes
+        self.id_offset = 0
+
+    def __repr__(self):
+        return f"Requirement(name={self.name}, choose={self.courses_to_choose}, codes={self.codes})"
+
+class RequirementGroup:
+    """A catalog section (e.g. 'Preparation for the Major') holding requirements."""
+    def __init__(self, name: str, group_type: str, num_to_choose: Optional[int] = None):
+        self.name = name[:191]
+        self.type = group_type
+        self.num_to_choose = num_to_choose
+        self.requirements: List[Requirement] = []
+        self.id_offset = 0
+
+    @property
+    def num_requirements_to_choose(self) -> int:
+        """All requirements, unless the section said "N of the following"."""
+        if self.num_to_choose:
+            return min(self.num_to_choose, len(self.requirements))
+        return len(self.requirements)
+
+    def __repr__(self):
+        return f"RequirementGroup(name={self.name}, type={self.type}, requirements={len(self.requirements)})"
+
+class MajorRequirements:
+    """All requirement groups scraped for one major."""
+    def __init__(self, major_name: str, groups: List[RequirementGroup]):
+        self.major_name = major_name
+        self.groups = groups
+
+    def __repr__(self):
+        return f"MajorRequirements(major={self.major_name}, groups={len(self.groups)})"
+
+def get_group_type(heading: str) -> str:
+    """Gets the RequirementGroup.type the frontend categorizes a heading under."""
+    lowered = heading.lower()
+    for keyword, group_type in GROUP_TYPE_MAP.items():
+        if keyword in lowered:
+            return group_type
+    return 'Major'
+
+def parse_count(word: str) -> int:
+    return NUMBER_WORDS.get(word.lower()) or int(word)
+
+def resolve_subject(run: str, at_sentence_start: bool) -> Tuple[Optional[str], str]:
+    """Finds the longest known subject at the end of a capitalized run.
+
+    Returns (abbreviation, leading prose), e.g. "Complete Computer Science"
+    gives ("COM SCI", "Complete"). The abbreviation is None if no known
+    subject ends the run, or if the leading prose looks like the start of
+    an unknown subject ("Electrical Engineering" is not "Engineering"): a
+    capitalized word directly before the subject is only accepted as the
+    first word of a sentence, and never before a SUFFIX_SUBJECTS entry.
+    """
+    words = run.split()
+    for i in range(len(words)):
+        subject = " ".join(words[i:])
+        if subject not in KNOWN_SUBJECTS:
+            continue
+        prose = words[:i]
+        if prose and prose[-1] != 'and' and (
+            len(prose) > 1 or not at_sentence_start or subject in SUFFIX_SUBJECTS
+        ):
+            return None, run
+        return KNOWN_SUBJECTS[subject], " ".join(prose)
+    return None, run
+
+def find_courses(text: str) -> List[Tuple[str, Optional[str]]]:
+    """Extracts course codes from a line of catalog prose.
+
+    Returns (code, separator) pairs where separator is ',', 'and' or 'or'
+    when the course continues the list of the previous one, and None when
+    prose (or a skipped unknown subject) stands between them.
+    """
+    courses: List[Tuple[str, Optional[str]]] = []
+    last_end = 0
+    for match in COURSE_RUN_RE.finditer(text):
+        at_sentence_start = re.search(r"(?:^|[.:;!?])\s*$", text[:match.start(1)]) is not None
+        subject_abbr, prose = resolve_subject(match.group(1), at_sentence_start)
+        if subject_abbr is None:
+            print(f"Warning: Skipping '{match.group(0)}', unknown subject '{match.group(1)}'", file=sys.stderr)
+            continue
+
+        between = text[last_end:match.start(1)] + prose
+        for num in CAT_NUM_RE.finditer(text, match.start(2), match.end(2)):
+            if last_end > match.start(1):
+                between = text[last_end:num.start()]
+            separator = LIST_SEPARATOR_RE.fullmatch(between) if courses else None
+            kind = (separator.group(1) or ',').lower() if separator else None
+            courses.append((f"{subject_abbr} {num.group(0)}", kind))
+            last_end = num.end()
+    return courses
+
+def group_alternatives(courses: List[Tuple[str, Optional[str]]]) -> List[List[str]]:
+    """Splits a line's courses into requirements, one list of codes per requirement.
+
+    Only courses joined by "or" are alternatives of one requirement, every
+    other course is required: "A, B, C or D" is A, B and a choice between
+    C and D. Lists where any listed course will do say so with "one of"
+    and are handled by CHOOSE_RE instead.
+    """
+    alternatives: List[List[str]] = []
+    for code, kind in courses:
+        if kind == 'or' and alternatives:
+            if code not in alternatives[-1]:
+                alternatives[-1].append(code)
+        elif [code] not in alternatives:
+            alternatives.append([code])
+    return alternatives
+
+def parse_requirements(heading: str, text: str) -> List[Requirement]:
+    """Turns one requirement line into Requirement rows.
+
+    "two courses from X, Y, Z" becomes a single requirement choosing 2 and
+    "20 units from ..." one choosing 20 / DEFAULT_UNITS courses. Only the
+    courses after that phrase are choices, courses before it are read like
+    any other list: "X or Y" is one requirement choosing 1 and other
+    courses are required.
+    """
+    choose = CHOOSE_RE.search(text)
+    listed_text = text[:choose.start()] if choose else text
+    requirements = [
+        Requirement(f"{heading} - {' or '.join(codes)}", 1, codes)
+        for codes in group_alternatives(find_courses(listed_text))
+    ]
+
+    if choose:
+        codes = list(dict.fromkeys(code for code, _ in find_courses(text[choose.end():])))
+        if codes:
+            courses_to_choose = parse_count(choose.group(1))
+            if choose.group(2) and choose.group(2).lower().startswith('unit'):
+                courses_to_choose = math.ceil(courses_to_choose / DEFAULT_UNITS)
+            requirements.append(
+                Requirement(f"{heading} - {courses_to_choose} from {', '.join(codes)}", courses_to_choose, codes)
+            )
+
+    return requirements
+
+def parse_major_page(major_name: str, html: str) -> MajorRequirements:
+    """Parses a catalog major page (or a local fixture of one) into requirement groups.
+
+    Each h2-h4 heading starts a group. A group needs all of its requirements
+    unless the heading, or a course-less line before its first requirement,
+    says "N of the following". Alternatives spread over several headings
+    (e.g. "complete one of the following tracks") are not modeled.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    root = soup.select_one('#requirements') or soup.body or soup
+
+    groups: List[RequirementGroup] = []
+    current_group: Optional[RequirementGroup] = None
+    heading = ""
+    # Level of a skipped heading (e.g. 3 for h3), its sub-headings are skipped too
+    skipped_level: Optional[int] = None
+    seen_names = set()
+
+    for element in root.find_all(['h2', 'h3', 'h4', 'li', 'p']):
+        if element.name in ('h2', 'h3', 'h4'):
+            level = int(element.name[1])
+            if skipped_level is not None and level > skipped_level:
+                continue
+            skipped_level = None
+
+            heading = element.get_text(" ", strip=True)
+            if not heading or heading.lower().startswith(SKIPPED_HEADINGS):
+                skipped_level = level if heading else None
+                current_group = None
+                continue
+            group_choose = GROUP_CHOOSE_RE.search(heading)
+            current_group = RequirementGroup(
+                f"{major_name} - {heading}",
+                get_group_type(heading),
+                parse_count(group_choose.group(1)) if group_choose else None,
+            )
+            groups.append(current_group)
+            continue
+
+        # Nested items are read as part of their top-level item
+        if current_group is None or element.find_parent('li'):
+            continue
+
+        text = element.get_text(" ", strip=True)
+        requirements = parse_requirements(heading, text)
+        if not requirements and not current_group.requirements:
+            group_choose = GROUP_CHOOSE_RE.search(text)
+            if group_choose:
+                current_group.num_to_choose = parse_count(group_choose.group(1))
+
+        for requirement in requirements:
+            if (current_group.name, requirement.name) in seen_names:
+                continue
+            seen_names.add((current_group.name, requirement.name))
+            current_group.requirements.append(requirement)
+
+    return MajorRequirements(major_name, [g for g in groups if g.requirements])
+
+def fetch_page(major_name: str, fixtures_dir: Optional[str] = None) -> str:
+    """Loads a major page from the catalog, or from <fixtures_dir>/<slug>.html."""
+    slug = MAJOR_PAGES[major_name]
+    if fixtures_dir:
+        with open(os.path.join(fixtures_dir, f"{slug}.html"), encoding="utf-8") as f:
+            return f.read()
+
+    request = urllib.request.Request(
+        CATALOG_MAJOR_URL.format(slug=slug),
+        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36"},
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read().decode("utf-8")
+
+def scrape_majors(major_names: List[str], fixtures_dir: Optional[str] = None, max_workers: int = 8) -> List[MajorRequirements]:
+    """Fetches and parses all majors concurrently, skipping any that fail."""
+    results: Dict[str, MajorRequirements] = {}
+
+    def scrape_one(major_name: str) -> MajorRequirements:
+        major = parse_major_page(major_name, fetch_page(major_name, fixtures_dir))
+        if not major.groups:
+            # An empty result would otherwise wipe the major's current requirements
+            raise ValueError("no requirement groups found on the page, leaving its requirements unchanged")
+        return major
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(scrape_one, name): name for name in major_names}
+        for future in as_completed(futures):
+            major_name = futures[future]
+            try:
+                results[major_name] = future.result()
+                print(f"Scraped {major_name}: {len(results[major_name].groups)} requirement groups")
+            except Exception as e:
+                print(f"Error scraping major '{major_name}': {e}", file=sys.stderr)
+
+    # Keep input order so the generated script is deterministic
+    return [results[name] for name in major_names if name in results]
+
+def assign_ids(majors: List[MajorRequirements]):
+    """Numbers requirements and groups 1..n, added to @req_base / @grp_base in SQL."""
+    req_offset = 0
+    grp_offset = 0
+    for major in majors:
+        for group in major.groups:
+            grp_offset += 1
+            group.id_offset = grp_offset
+            for requirement in group.requirements:
+                req_offset += 1
+                requirement.id_offset = req_offset
+
+def sql_str(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
+
+def bulk_insert(prefix: str, rows: List[str]) -> List[str]:
+    """Builds multi-row INSERT statements of at most SQL_BATCH_SIZE rows each."""
+    return [
+        f"{prefix} VALUES\n  " + ",\n  ".join(rows[i:i + SQL_BATCH_SIZE]) + ";"
+        for i in range(0, len(rows), SQL_BATCH_SIZE)
+    ]
+
+def generate_sql_script(majors: List[MajorRequirements]) -> str:
+    """Generates one transactional, set-based SQL script for the whole requirement graph.
+
+    Majors without any parsed group are left out so their current
+    requirements are not deleted. Requirements none of whose classes exist
+    in Class are left out too, and so are groups left without requirements.
+    """
+    for major in majors:
+        if not major.groups:
+            print(f"Warning: Skipping major '{major.major_name}', no requirement groups were parsed", file=sys.stderr)
+    majors = [m for m in majors if m.groups]
+    assign_ids(majors)
+
+    requirement_rows, group_rows, req_class_rows, major_group_rows = [], [], [], []
+    for major in majors:
+        for group in major.groups:
+            grp_id = f"@grp_base + {group.id_offset}"
+            group_rows.append(f"({grp_id}, {sql_str(group.name)}, {group.num_requirements_to_choose}, {sql_str(group.type)})")
+            major_group_rows.append(f"({sql_str(major.major_name)}, {grp_id})")
+            for requirement in group.requirements:
+                req_id = f"@req_base + {requirement.id_offset}"
+                requirement_rows.append(f"({req_id}, {grp_id}, {sql_str(requirement.name)}, {requirement.courses_to_choose})")
+                for code in requirement.codes:
+                    req_class_rows.append(f"({req_id}, {sql_str(code)})")
+
+    major_rows = [f"({sql_str(m.major_name)})" for m in majors]
+
+    sql_lines = [
+        "-- ========================================================",
+        f"-- MAJOR REQUIREMENTS FOR {len(majors)} MAJORS",
+        "-- Every non-GE requirement group of these majors (scraped or",
+        "-- entered by hand) is replaced; 'GE' and untyped groups are kept.",
+        "-- Classes are not created: requirements are only linked to",
+        "-- classes already in Class, requirements with none of their",
+        "-- classes in Class are left out, and the final SELECTs list",
+        "-- the missing codes and the requirements left out.",
+        "-- Ids are reserved past the current MAX(id) of each table.",
+        "-- ========================================================",
+        "",
+        "START TRANSACTION;",
+        "",
+        "CREATE TEMPORARY TABLE _scraped_major (name VARCHAR(191) COLLATE utf8mb4_bin NOT NULL PRIMARY KEY);",
+        "CREATE TEMPORARY TABLE _scraped_major_group (name VARCHAR(191) COLLATE utf8mb4_bin NOT NULL, reqGroupId INT NOT NULL);",
+        "CREATE TEMPORARY TABLE _scraped_req (id INT NOT NULL PRIMARY KEY, reqGroupId INT NOT NULL, name VARCHAR(191) NOT NULL, coursesToChoose INT NOT NULL);",
+        "CREATE TEMPORARY TABLE _scraped_group (id INT NOT NULL PRIMARY KEY, name VARCHAR(191) NOT NULL, numRequirementsToChoose INT NOT NULL, type VARCHAR(50) NOT NULL);",
+        "CREATE TEMPORARY TABLE _scraped_req_class (reqId INT NOT NULL, code VARCHAR(191) COLLATE utf8mb4_unicode_ci NOT NULL);",
+        "CREATE TEMPORARY TABLE _stale_group (id INT NOT NULL PRIMARY KEY);",
+        "CREATE TEMPORARY TABLE _stale_req (id INT NOT NULL PRIMARY KEY);",
+        "",
+        "-- ========================================================",
+        "-- STEP 1: MAJORS",
+        "-- ========================================================",
+        "",
+        *bulk_insert("INSERT INTO _scraped_major (name)", major_rows),
+        "",
+        "INSERT INTO Major (name)",
+        "SELECT s.name FROM _scraped_major s LEFT JOIN Major m ON m.name COLLATE utf8mb4_bin = s.name WHERE m.id IS NULL;",
+        "",
+        "-- ========================================================",
+        "-- STEP 2: REMOVE THE CURRENT NON-GE GROUPS OF THESE MAJORS",
+        "-- ========================================================",
+        "",
+        "INSERT INTO _stale_group (id)",
+        "SELECT DISTINCT mrg.requirementGroupId FROM MajorRequirementGroup mrg",
+        "JOIN Major m ON m.id = mrg.majorId",
+        "JOIN _scraped_major s ON s.name = m.name COLLATE utf8mb4_bin",
+        "JOIN RequirementGroup rg ON rg.id = mrg.requirementGroupId",
+        "WHERE rg.type <> 'GE';",
+        "",
+        "DELETE mrg FROM MajorRequirementGroup mrg",
+        "JOIN Major m ON m.id = mrg.majorId",
+        "JOIN _scraped_major s ON s.name = m.name COLLATE utf8mb4_bin",
+        "JOIN _stale_group g ON g.id = mrg.requirementGroupId;",
+        "",
+        "-- Groups still linked to a major that is not being refreshed are kept",
+        "DELETE g FROM _stale_group g JOIN MajorRequirementGroup mrg ON mrg.requirementGroupId = g.id;",
+        "",
+        "INSERT INTO _stale_req (id)",
+        "SELECT DISTINCT rig.reqId FROM RequirementsInGroup rig JOIN _stale_group g ON g.id = rig.reqGroupId;",
+        "",
+        "DELETE rig FROM RequirementsInGroup rig JOIN _stale_group g ON g.id = rig.reqGroupId;",
+        "",
+        "-- Requirements shared with a kept group are kept",
+        "DELETE r FROM _stale_req r JOIN RequirementsInGroup rig ON rig.reqId = r.id;",
+        "",
+        "DELETE rc FROM RequirementClasses rc JOIN _stale_req r ON r.id = rc.reqId;",
+        "DELETE req FROM Requirement req JOIN _stale_req r ON r.id = req.id;",
+        "DELETE rg FROM RequirementGroup rg JOIN _stale_group g ON g.id = rg.id;",
+        "",
+        "-- ========================================================",
+        "-- STEP 3: INSERT THE NEW REQUIREMENT GRAPH",
+        "-- ========================================================",
+        "",
+        "SELECT COALESCE(MAX(id), 0) INTO @req_base FROM Requirement FOR UPDATE;",
+        "SELECT COALESCE(MAX(id), 0) INTO @grp_base FROM RequirementGroup FOR UPDATE;",
+        "",
+        *bulk_insert("INSERT INTO _scraped_req (id, reqGroupId, name, coursesToChoose)", requirement_rows),
+        "",
+        *bulk_insert("INSERT INTO _scraped_group (id, name, numRequirementsToChoose, type)", group_rows),
+        "",
+        *bulk_insert("INSERT INTO _scraped_req_class (reqId, code)", req_class_rows),
+        "",
+        *bulk_insert("INSERT INTO _scraped_major_group (name, reqGroupId)", major_group_rows),
+        "",
+        "-- Only requirements that at least one existing class can fulfill",
+        "INSERT INTO Requirement (id, name, coursesToChoose)",
+        "SELECT r.id, r.name, r.coursesToChoose FROM _scraped_req r",
+        "WHERE EXISTS (SELECT 1 FROM _scraped_req_class s JOIN Class c ON c.code = s.code WHERE s.reqId = r.id);",
+        "",
+        "-- Only groups with a kept requirement, never choosing more than were kept",
+        "INSERT INTO RequirementGroup (id, name, numRequirementsToChoose, type)",
+        "SELECT g.id, g.name, LEAST(g.numRequirementsToChoose, k.numRequirements), g.type FROM _scraped_group g",
+        "JOIN (",
+        "  SELECT r.reqGroupId, COUNT(*) AS numRequirements FROM _scraped_req r",
+        "  JOIN Requirement req ON req.id = r.id GROUP BY r.reqGroupId",
+        ") k ON k.reqGroupId = g.id;",
+        "",
+        "INSERT INTO RequirementsInGroup (reqId, reqGroupId)",
+        "SELECT r.id, r.reqGroupId FROM _scraped_req r JOIN Requirement req ON req.id = r.id;",
+        "",
+        "INSERT IGNORE INTO RequirementClasses (reqId, classId)",
+        "SELECT s.reqId, c.id FROM _scraped_req_class s",
+        "JOIN Class c ON c.code = s.code",
+        "JOIN Requirement req ON req.id = s.reqId;",
+        "",
+        "INSERT IGNORE INTO MajorRequirementGroup (majorId, requirementGroupId)",
+        "SELECT m.id, s.reqGroupId FROM _scraped_major_group s",
+        "JOIN Major m ON m.name COLLATE utf8mb4_bin = s.name",
+        "JOIN RequirementGroup rg ON rg.id = s.reqGroupId;",
+        "",
+        "-- Classes are not created here, these codes need to be added to Class first",
+        "SELECT DISTINCT s.code AS missing_class FROM _scraped_req_class s",
+        "LEFT JOIN Class c ON c.code = s.code WHERE c.id IS NULL ORDER BY s.code;",
+        "",
+        "SELECT r.name AS skipped_requirement FROM _scraped_req r",
+        "LEFT JOIN Requirement req ON req.id = r.id WHERE req.id IS NULL ORDER BY r.id;",
+        "",
+        "DROP TEMPORARY TABLE _scraped_major, _scraped_major_group, _scraped_req, _scraped_group, _scraped_req_class, _stale_group, _stale_req;",
+        "",
+        "COMMIT;",
+    ]
+    return "\n".join(sql_lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape major requirements into a bulk SQL script.")
+    parser.add_argument("majors", nargs="*", help="Major names to scrape (default: all in MAJOR_PAGES)")
+    parser.add_argument("--fixtures", help="Read <slug>.html pages from this directory instead of the catalog")
+    parser.add_argument("--workers", type=int, default=8, help="Number of pages fetched concurrently")
+    parser.add_argument("--output", default="major_requirements.sql")
+    args = parser.parse_args()
+
+    major_names = args.majors or list(MAJOR_PAGES.keys())
+    unknown = [name for name in major_names if name not in MAJOR_PAGES]
+    if unknown:
+        print(f"Unknown majors (add them to MAJOR_PAGES): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    majors = scrape_majors(major_names, args.fixtures, args.workers)
+
+    if not majors:
+        print("\nNo majors were parsed. This might be a script error or the source website is down.", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"\nSuccessfully parsed {len(majors)} majors.")
+
+    final_sql_script = generate_sql_script(majors)
+
+    try:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(final_sql_script)
+        print(f"\nSQL script saved to: {args.output}")
+    except IOError as e:
+        print(f"\nError writing to file: {e}", file=sys.stderr)
@@ -0,0 +1,109 @@
+import os
+
+from major_scraper import (
+    MajorRequirements,
+    fetch_page,
+    generate_sql_script,
+    parse_major_page,
+    scrape_majors,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_major() -> MajorRequirements:
+    return parse_major_page("Computer Science", fetch_page("Computer Science", FIXTURES_DIR))
+
+
+def requirement_codes(group):
+    return [(r.codes, r.courses_to_choose) for r in group.requirements]
+
+
+def test_groups_and_types():
+    major = load_major()
+    assert [(g.name, g.type) for g in major.groups] == [
+        ("Computer Science - Preparation for the Major", "Prep"),
+        ("Computer Science - The Major", "Major"),
+        ("Computer Science - Sci-tech Electives", "Major"),
+    ]
+
+
+def test_ge_subsections_are_skipped():
+    codes = {code for g in load_major().groups for r in g.requirements for code in r.codes}
+    assert "ENGCOMP 3" not in codes
+    assert "LIFESCI 7B" not in codes
+
+
+def test_required_courses_and_or_alternatives():
+    prep = load_major().groups[0]
+    assert requirement_codes(prep) == [
+        (["COM SCI 1"], 1),
+        (["COM SCI 31"], 1),
+        (["COM SCI 32"], 1),
+        (["COM SCI 33"], 1),
+        (["COM SCI 35L"], 1),
+        (["COM SCI M51A"], 1),
+        # "Mathematics 31A or 31B, Physics 1A"
+        (["MATH 31A", "MATH 31B"], 1),
+        (["PHYSICS 1A"], 1),
+        # "Physics 1A, 1B, 1C, 4AL or 4BL", PHYSICS 1A is already listed
+        (["PHYSICS 1B"], 1),
+        (["PHYSICS 1C"], 1),
+        (["PHYSICS 4AL", "PHYSICS 4BL"], 1),
+    ]
+
+
+def test_non_course_prose_is_skipped():
+    codes = {code for g in load_major().groups for r in g.requirements for code in r.codes}
+    assert not any("GPA" in code or "COMPLETE" in code for code in codes)
+    assert "ENGR 100" not in codes
+    assert "COM SCI 180" in codes
+
+
+def test_choose_courses_and_units():
+    assert requirement_codes(load_major().groups[1]) == [
+        (["COM SCI 111"], 1),
+        (["COM SCI 118"], 1),
+        (["COM SCI 131"], 1),
+        (["COM SCI 130", "COM SCI 132"], 1),
+        (["COM SCI 180"], 1),
+        (["COM SCI CM121", "COM SCI 143", "EC ENGR 132B"], 2),
+        (["COM SCI 145", "COM SCI 161", "COM SCI 174A", "COM SCI M146", "COM SCI 188"], 5),
+    ]
+
+
+def test_group_choose_from_intro():
+    sci_tech = load_major().groups[2]
+    assert len(sci_tech.requirements) == 3
+    assert sci_tech.num_requirements_to_choose == 2
+
+
+def test_scrape_majors_skips_missing_pages():
+    majors = scrape_majors(["Computer Science", "Bioengineering"], FIXTURES_DIR)
+    assert [m.major_name for m in majors] == ["Computer Science"]
+
+
+def test_generate_sql_script_skips_majors_without_groups():
+    empty = parse_major_page("Bioengineering", "<div id=app></div>")
+    sql = generate_sql_script([empty, load_major()])
+    assert "'Bioengineering'" not in sql
+    assert "-- MAJOR REQUIREMENTS FOR 1 MAJORS" in sql
+
+
+def test_generate_sql_script_shape():
+    sql = generate_sql_script([load_major()])
+
+    assert sql.index("START TRANSACTION;") < sql.index("COMMIT;")
+    assert "INTO Class" not in sql
+    assert "LIKE" not in sql
+    assert "WHERE rg.type <> 'GE';" in sql
+    assert sql.index("DELETE rg FROM RequirementGroup") < sql.index("INTO @req_base")
+    assert "(@req_base + 1, @grp_base + 1, 'Preparation for the Major - COM SCI 1', 1)" in sql
+    assert "(@grp_base + 3, 'Computer Science - Sci-tech Electives', 2, 'Major')" in sql
+    assert "(@req_base + 7, 'MATH 31A'),\n  (@req_base + 7, 'MATH 31B')" in sql
+    assert "('Computer Science', @grp_base + 1)" in sql
+    # Requirements without an existing class are left out, not inserted
+    assert "WHERE EXISTS (SELECT 1 FROM _scraped_req_class s JOIN Class c" in sql
+    assert "LEAST(g.numRequirementsToChoose, k.numRequirements)" in sql
+    assert "AS missing_class" in sql
+    assert "AS skipped_requirement" in sql